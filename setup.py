@@ -28,6 +28,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/65156/tofUI",
     packages=find_packages(),
+    package_data={"tofui.assets": ["*.css", "*.js"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -50,6 +51,9 @@ setup(
         "boto3>=1.26.0",     # S3 dashboard hosting
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",     # faster plan parsing and report serialization
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -173,6 +173,22 @@ class TofUITests(unittest.TestCase):
         
         print(f"✅ Analysis test passed - {analysis.total_resources} resources found")
 
+    def test_output_type_labels(self):
+        """Test output type labels for homogeneous and mixed lists"""
+        print("\n🏷️  Testing output type labels...")
+
+        generator = HTMLGenerator()
+        infer = lambda value: generator._infer_output_type(value, {}, "out")
+
+        self.assertEqual(infer(["a", "b"]), "list(string)")
+        self.assertEqual(infer([1, 2]), "list(number)")
+        self.assertEqual(infer([]), "list")
+        # Mixed (tuple-like) outputs keep the plain list label
+        self.assertEqual(infer([1, "a"]), "list")
+        self.assertEqual(infer([1, 2.0]), "list")
+
+        print("✅ Output type label test passed")
+
     def test_html_generation(self):
         """Test HTML report generation"""
         print("\n🎨 Testing HTML generation...")
@@ -200,8 +216,101 @@ class TofUITests(unittest.TestCase):
         self.assertIn("tofUI", html_content)  # Should show tofUI branding
         self.assertIn("aws_instance.web", html_content)
         
+        # Streaming the report should produce the same document
+        import io
+        buffer = io.StringIO()
+        generator.write_html_report(analysis, buffer, plan_name="Test Infrastructure")
+        self.assertEqual(buffer.getvalue(), html_content)
+        
         print("✅ HTML generation test passed")
 
+    def test_html_generation_gzip(self):
+        """Test gzip-compressed HTML report output"""
+        print("\n🗜️  Testing gzip HTML generation...")
+        
+        import gzip
+        
+        parser = TerraformPlanParser()
+        plan = parser.parse_file(self.test_plan)
+        
+        analyzer = PlanAnalyzer()
+        analysis = analyzer.analyze(plan)
+        
+        generator = HTMLGenerator()
+        output_file = os.path.join(self.test_dir, "test_report.html.gz")
+        
+        html_content = generator.generate_report(
+            analysis,
+            plan_name="Test Infrastructure", 
+            output_file=output_file
+        )
+        
+        with gzip.open(output_file, 'rt', encoding='utf-8') as f:
+            self.assertEqual(f.read(), html_content)
+        
+        print("✅ Gzip HTML generation test passed")
+
+    def test_error_report_streaming(self):
+        """Test streaming error and apply reports from a fresh generator"""
+        print("\n🌊 Testing streamed error and apply reports...")
+        
+        import io
+        from tofui.apply_parser import TerraformApplyParser
+        
+        error_output = "╷\n│ Error: Invalid reference\n│ \n│   on main.tf line 3:\n│ Detail text\n╵\n"
+        writer = HTMLGenerator()
+        reference = HTMLGenerator()
+        reference._formatted_time = writer._formatted_time  # same header timestamp
+        html_content = reference.generate_error_report(error_output=error_output, plan_name="Broken Plan")
+        
+        buffer = io.StringIO()
+        writer.write_error_html(buffer, error_output=error_output, plan_name="Broken Plan")
+        
+        self.assertEqual(buffer.getvalue(), html_content)
+        self.assertIn("Invalid reference", html_content)
+        
+        apply_log = (
+            "aws_instance.web: Creating...\n"
+            "aws_instance.web: Creation complete after 2s [id=i-123]\n"
+            "Apply complete! Resources: 1 added, 0 changed, 0 destroyed.\n"
+        )
+        apply_result = TerraformApplyParser().parse_apply_log(apply_log, 0)
+        writer = HTMLGenerator()
+        reference._formatted_time = writer._formatted_time
+        html_content = reference.generate_apply_report(apply_result, plan_name="Applied")
+        
+        buffer = io.StringIO()
+        writer.write_apply_html(apply_result, buffer, plan_name="Applied")
+        
+        self.assertEqual(buffer.getvalue(), html_content)
+        self.assertIn("aws_instance.web", html_content)
+        
+        print("✅ Streamed error and apply report test passed")
+
+    def test_resource_operations_section(self):
+        """Test the apply report's resource operation rows"""
+        print("\n🛠️  Testing resource operations section...")
+
+        from datetime import timedelta
+        from tofui.apply_parser import ResourceOperation, ResourceAction
+
+        operations = [
+            ResourceOperation("aws_instance.web", "aws_instance", ResourceAction.CREATED, "completed",
+                              duration=timedelta(seconds=12)),
+            ResourceOperation("aws_s3_bucket.<logs>", "aws_s3_bucket", ResourceAction.DESTROYING, "failed"),
+        ]
+
+        generator = HTMLGenerator()
+        section = "".join(generator._iter_resource_operations_section(operations))
+
+        self.assertIn("Resource Operations", section)
+        self.assertIn("aws_instance.web", section)
+        self.assertIn("0:00:12", section)
+        self.assertIn("aws_s3_bucket.&lt;logs&gt;", section)
+        self.assertEqual("".join(generator._iter_resource_operations_section([])), "")
+
+        print("✅ Resource operations section test passed")
+
     def test_configuration_loading(self):
         """Test configuration file loading"""
         print("\n⚙️  Testing configuration loading...")
@@ -380,9 +489,114 @@ class TofUITests(unittest.TestCase):
             self.fail("Expected parsing to fail for non-existent file")
         except Exception:
             pass  # Expected failure
-        
+
+        # Oddly shaped JSON error data falls back to text parsing
+        for plan_error_data in ('{"errors": 5}', '{"diagnostics": ["x"]}', '["errors"]'):
+            html_content = HTMLGenerator().generate_error_report(plan_error_data=plan_error_data)
+            self.assertIn("The plan failed with exit code 1", html_content)
+
         print("✅ Error handling test passed")
 
+    def test_retry_after_is_capped(self):
+        """Test that a huge or invalid Retry-After header cannot stall retries"""
+        print("\n⏳ Testing Retry-After cap...")
+
+        from tofui import publisher
+
+        def response(status, retry_after):
+            return MagicMock(status_code=status, reason="", headers={"Retry-After": retry_after})
+
+        self.assertEqual(publisher._retry_after_seconds(response(503, "99999999")), publisher._MAX_RETRY_AFTER)
+        for bad in ("inf", "nan", "-5", "soon"):
+            self.assertEqual(publisher._retry_after_seconds(response(503, bad)), 0.0)
+
+        session = MagicMock()
+        session.get.side_effect = [response(503, "99999999"), response(200, None)]
+        with patch.object(publisher, "_get_session", return_value=session), \
+                patch("tofui.publisher.time.sleep") as mock_sleep:
+            success, _ = publisher.github_api_request_with_retry("https://api.test", {}, {}, method="GET", max_retries=2)
+
+        self.assertTrue(success)
+        mock_sleep.assert_called_once()
+        self.assertLessEqual(mock_sleep.call_args[0][0], publisher._MAX_RETRY_AFTER)
+
+        print("✅ Retry-After cap test passed")
+
+    def test_find_oldest_slot(self):
+        """Test slot selection from the directory listing and the per-slot probes"""
+        print("\n🎰 Testing slot selection...")
+
+        import base64
+        import contextlib
+        import io
+        from tofui import publisher
+
+        api, repo = "https://api.test", "owner/dashboard"
+        listing_url = f"{api}/repos/{repo}/contents/reports?ref=main"
+        reports = {
+            slot: {"timestamp": f"2024-01-0{8 - slot}T00:00:00Z"} for slot in range(1, 8)
+        }  # slot 7 is the oldest
+
+        def slot_name(slot):
+            return publisher.get_slot_filename("owner/app", "infra", "plan", slot)
+
+        def listing(slots, extra=0):
+            entries = [{"name": slot_name(slot), "sha": f"list-{slot}"} for slot in slots]
+            entries += [{"name": f"other-{i}.json", "sha": "x"} for i in range(extra)]
+            return True, MagicMock(status_code=200, json=MagicMock(return_value=entries))
+
+        def fake_api(listing_result):
+            calls = []
+
+            def request(url, headers, data, method="PUT", max_retries=12, log=print):
+                calls.append((url, headers))
+                if url == listing_url:
+                    return listing_result
+                slot = int(url.split("?")[0][-8:-5])
+                log(f"probe {slot}")
+                body = json.dumps(reports[slot]).encode()
+                if headers.get("Accept") == "application/vnd.github.v3.raw":
+                    return True, MagicMock(status_code=200, content=body)
+                envelope = {"content": base64.b64encode(body).decode(), "sha": f"env-{slot}"}
+                return True, MagicMock(status_code=200, json=MagicMock(return_value=envelope))
+
+            return calls, request
+
+        def find(listing_result):
+            calls, request = fake_api(listing_result)
+            output = io.StringIO()
+            with patch.object(publisher, "github_api_request_with_retry", side_effect=request), \
+                    contextlib.redirect_stdout(output):
+                result = publisher.find_oldest_slot(api, repo, "owner/app", "infra", "plan", "main", {})
+            return result, calls, output.getvalue()
+
+        # No reports directory yet: every slot is free, without probing
+        result, calls, _ = find((False, MagicMock(status_code=404)))
+        self.assertEqual(result, (1, None, None))
+        self.assertEqual(len(calls), 1)
+
+        # The first gap in the listing is returned straight away
+        result, calls, _ = find(listing([1, 2, 4]))
+        self.assertEqual(result, (3, None, None))
+        self.assertEqual(len(calls), 1)
+
+        # Full listing: raw bodies are fetched and the sha comes from the listing
+        result, calls, output = find(listing(range(1, 8)))
+        self.assertEqual(result, (7, "list-7", reports[7]))
+        self.assertTrue(all(h.get("Accept") == "application/vnd.github.v3.raw" for _, h in calls[1:]))
+        # Buffered probe logs are printed in slot order
+        probes = [line for line in output.splitlines() if line.startswith("probe")]
+        self.assertEqual(probes, [f"probe {slot}" for slot in range(1, 8)])
+
+        # A failed or truncated listing falls back to base64 envelopes
+        for fallback in ((False, MagicMock(status_code=500)), listing(range(1, 8), extra=1000)):
+            result, calls, _ = find(fallback)
+            self.assertEqual(result, (7, "env-7", reports[7]))
+            self.assertEqual(len(calls), 8)
+            self.assertTrue(all("Accept" not in h for _, h in calls[1:]))
+
+        print("✅ Slot selection test passed")
+
 def run_performance_test():
     """Run performance benchmarks"""
     print("\n⚡ Running performance tests...")
@@ -7,12 +7,13 @@ Analyzes parsed terraform plan data to extract meaningful insights and prepare d
 from typing import Dict, List, Any, Set, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
+from functools import cached_property
 import json
 
-from .parser import TerraformPlan, ResourceChange, ActionType
+from .parser import TerraformPlan, ResourceChange, ActionType, _DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PropertyChange:
     """Represents a change to a specific property of a resource"""
     property_path: str
@@ -114,6 +115,11 @@ class PlanAnalysis:
     @property
     def total_resources(self) -> int:
         return len(self.plan.resource_changes)
+    
+    @cached_property
+    def sorted_property_names(self) -> List[str]:
+        """Property names in display order, sorted once per analysis"""
+        return sorted(self.all_property_names)
 
 
 class PlanAnalyzer:
@@ -34,6 +34,15 @@ class ResourceAction(Enum):
     READING = "reading"
 
 
+# Operation status -> (css class, icon) used when rendering apply reports
+_STATUS_STYLES = {
+    "completed": ("completed", "✅"),
+    "in_progress": ("in_progress", "⏳"),
+    "failed": ("failed", "❌"),
+}
+_UNKNOWN_STATUS_STYLE = ("unknown", "❓")
+
+
 @dataclass
 class ResourceOperation:
     """Individual resource operation during apply"""
@@ -45,6 +54,11 @@ class ResourceOperation:
     end_time: Optional[datetime] = None
     duration: Optional[timedelta] = None
     error_message: Optional[str] = None
+    
+    @property
+    def status_style(self) -> Tuple[str, str]:
+        """(css class, icon) pair for the current status"""
+        return _STATUS_STYLES.get(self.status, _UNKNOWN_STATUS_STYLE)
 
 
 @dataclass
@@ -0,0 +1,3 @@
+"""
+Static stylesheets and scripts embedded into generated reports.
+"""
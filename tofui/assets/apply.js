@@ -0,0 +1,22 @@
+
+        // Initialize the apply page
+        document.addEventListener('DOMContentLoaded', function() {
+            // Initialize collapsible elements
+            collapseAllResources();
+            
+            // Auto-load logs
+            autoLoadLogs();
+        });
+        
+        function toggleResource(header) {
+            const resourceChange = header.closest('.resource-change');
+            resourceChange.classList.toggle('collapsed');
+        }
+        
+        function collapseAllResources() {
+            const resources = document.querySelectorAll('.resource-change');
+            resources.forEach(resource => {
+                resource.classList.add('collapsed');
+            });
+        }
+        
\ No newline at end of file
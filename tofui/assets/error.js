@@ -0,0 +1,12 @@
+
+        // Initialize the error page
+        document.addEventListener('DOMContentLoaded', function() {
+            // Auto-load logs for error pages
+            autoLoadLogs();
+        });
+        
+        function toggleResource(header) {
+            const resourceChange = header.closest('.resource-change');
+            resourceChange.classList.toggle('collapsed');
+        }
+        
\ No newline at end of file
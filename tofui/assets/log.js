@@ -0,0 +1,144 @@
+
+        // Terminal log panel shared by plan, error and apply reports
+        function autoLoadLogs() {
+            // Try different log locations based on environment
+            const baseName = window.location.pathname.split('/').pop().replace('.html', '');
+            
+            const logUrls = [
+                `${baseName}.log`,  // Local: same directory
+                `../logs/${baseName}.log`,  // GitHub Pages: logs folder
+                `logs/${baseName}.log`  // Alternative GitHub Pages path
+            ];
+            
+            tryLoadLog(logUrls, 0);
+        }
+        
+        // Lines that mark the start of the relevant part of a terraform log
+        const TRIGGER_RE = /Terraform will perform the following actions:|Terraform planned the following actions, but then encountered a problem:|No changes\. Your infrastructure matches the configuration\./;
+        
+        function filterTerraformLogs(logContent) {
+            // Single regex scan over the whole log instead of per-line, per-pattern checks
+            const idx = logContent.search(TRIGGER_RE);
+            
+            // If no trigger found, return original content
+            if (idx === -1) {
+                return logContent;
+            }
+            
+            // Return content starting from the trigger line
+            return logContent.slice(logContent.lastIndexOf('\n', idx) + 1);
+        }
+        
+        // Trigger phrases are shorter than this; each search resumes this far back so
+        // a phrase split across two network chunks is still found
+        const TRIGGER_OVERLAP = 128;
+        
+        // Text after the trigger is added to the page in batches of this many characters
+        const LOG_FLUSH_CHARS = 64 * 1024;
+        
+        // Text shown in the log panel, kept so copying does not read it back from the DOM
+        let logChunks = null;
+        
+        async function streamLogInto(response, output) {
+            logChunks = null;
+            
+            // Browsers without streaming response bodies read the whole log at once
+            if (!response.body || typeof TextDecoder === 'undefined') {
+                const filtered = filterTerraformLogs(await response.text());
+                output.textContent = filtered;
+                logChunks = [filtered];
+                return;
+            }
+            
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let seen = [];     // chunks read so far (only those shown once the trigger is found)
+            let tail = '';     // end of the text searched so far
+            let pending = '';  // text after the trigger not yet added to the page
+            let found = false;
+            
+            while (true) {
+                const { done, value } = await reader.read();
+                const text = decoder.decode(value || new Uint8Array(), { stream: !done });
+                
+                if (!found) {
+                    // Only the new chunk (plus a little overlap) is searched each time
+                    seen.push(text);
+                    const recent = tail + text;
+                    const idx = recent.search(TRIGGER_RE);
+                    if (idx !== -1) {
+                        // Drop everything before the trigger line and start rendering
+                        found = true;
+                        const head = seen.join('');
+                        const start = head.length - recent.length + idx;
+                        const shown = head.slice(head.lastIndexOf('\n', start) + 1);
+                        output.textContent = shown;
+                        seen = [shown];
+                    } else {
+                        tail = recent.slice(-TRIGGER_OVERLAP);
+                    }
+                } else {
+                    pending += text;
+                    if (pending.length >= LOG_FLUSH_CHARS) {
+                        output.append(pending);
+                        seen.push(pending);
+                        pending = '';
+                    }
+                }
+                
+                if (done) break;
+            }
+            
+            if (!found) {
+                // If no trigger found, show the original content
+                seen = [seen.join('')];
+                output.textContent = seen[0];
+            } else if (pending) {
+                output.append(pending);
+                seen.push(pending);
+            }
+            logChunks = seen;
+        }
+        
+        function tryLoadLog(urls, index) {
+            if (index >= urls.length) {
+                document.getElementById('terminal-output').textContent = 
+                    'Error: Log file not found in any expected location\nTried:\n' + urls.join('\n');
+                return;
+            }
+            
+            fetch(urls[index])
+                .then(response => {
+                    if (!response.ok) throw new Error('Not found');
+                    return streamLogInto(response, document.getElementById('terminal-output'));
+                })
+                .catch(() => tryLoadLog(urls, index + 1));
+        }
+        
+        function copyToClipboard(elementId) {
+            const element = document.getElementById(elementId);
+            let text;
+            if (elementId === 'terminal-output' && logChunks) {
+                // Join once and keep the result for later copies
+                logChunks = [logChunks.join('')];
+                text = logChunks[0];
+            } else {
+                text = element.textContent;
+            }
+            
+            navigator.clipboard.writeText(text).then(function() {
+                // Show feedback
+                const btn = document.querySelector('.copy-btn');
+                const originalText = btn.textContent;
+                btn.textContent = 'Copied!';
+                btn.style.background = '#6c757d';
+                
+                setTimeout(function() {
+                    btn.textContent = originalText;
+                    btn.style.background = '#6c757d';
+                }, 2000);
+            }).catch(function(err) {
+                console.error('Could not copy text: ', err);
+                alert('Failed to copy to clipboard');
+            });
+        }
@@ -16,17 +16,7 @@ from .parser import TerraformPlanParser
 from .analyzer import PlanAnalyzer
 from .generator import HTMLGenerator
 from .apply_parser import TerraformApplyParser
-
-
-def sanitize_build_name(name: str) -> str:
-    """Sanitize build name for URL and file system safety"""
-    import re
-    # Replace ALL non-alphanumeric chars (except hyphens/dots) with hyphens
-    sanitized = re.sub(r'[^a-zA-Z0-9\-.]', '-', name)
-    # Collapse multiple hyphens
-    sanitized = re.sub(r'-+', '-', sanitized)
-    # Remove leading/trailing hyphens
-    return sanitized.strip('-').lower()
+from .naming import sanitize_build_name
 
 
 def read_terraform_errors_from_stdin():
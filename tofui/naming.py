@@ -0,0 +1,17 @@
+"""
+Build Name Helpers
+
+Dependency-free naming helpers shared by the CLI and the dashboard publisher.
+"""
+
+import re
+
+
+# Characters not allowed in build names, and the hyphen runs they collapse into
+_SANITIZE_BAD = re.compile(r'[^a-zA-Z0-9\-.]')
+_SANITIZE_DASHES = re.compile(r'-+')
+
+
+def sanitize_build_name(name: str) -> str:
+    """Sanitize build name for URL and file system safety"""
+    return _SANITIZE_DASHES.sub('-', _SANITIZE_BAD.sub('-', name)).strip('-').lower()
@@ -5,10 +5,21 @@ Parses terraform plan JSON output and extracts structured information about chan
 """
 
 import json
+import sys
+from collections import Counter
+from operator import attrgetter
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ActionType(Enum):
     """Terraform action types"""
@@ -20,7 +31,21 @@ class ActionType(Enum):
     NO_OP = "no-op"
 
 
-@dataclass
+# Every action list Terraform emits; anything else falls through to the
+# membership checks in _parse_action
+_ACTION_DISPATCH = {
+    (): ActionType.NO_OP,
+    ("create",): ActionType.CREATE,
+    ("delete",): ActionType.DELETE,
+    ("update",): ActionType.UPDATE,
+    ("read",): ActionType.READ,
+    ("no-op",): ActionType.READ,  # no-op means read-only operation
+    ("delete", "create"): ActionType.RECREATE,
+    ("create", "delete"): ActionType.RECREATE,
+}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ResourceChange:
     """Represents a change to a terraform resource"""
     address: str
@@ -54,7 +79,7 @@ class ResourceChange:
         return self.action == ActionType.RECREATE
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PlanSummary:
     """Summary of terraform plan changes"""
     create: int = 0
@@ -71,7 +96,7 @@ class PlanSummary:
         return self.total_changes > 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TerraformPlan:
     """Parsed terraform plan data"""
     terraform_version: str
@@ -92,8 +117,16 @@ class TerraformPlanParser:
     
     def parse_file(self, file_path: str) -> TerraformPlan:
         """Parse a terraform plan JSON file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Let json report the error (or accept what orjson is stricter about)
+                data = json.loads(raw)
+        else:
+            data = json.loads(raw)
         return self.parse_json(data)
     
     def parse_json(self, plan_data: Dict[str, Any]) -> TerraformPlan:
@@ -205,9 +238,10 @@ class TerraformPlanParser:
         
         return ResourceChange(
             address=address,
-            type=resource_type,
+            # Types and providers repeat across many resources; share one string each
+            type=sys.intern(resource_type),
             name=resource_name,
-            provider_name=change_data.get("provider_name", ""),
+            provider_name=sys.intern(change_data.get("provider_name", "")),
             action=action,
             before=change_info.get("before"),
             after=change_info.get("after"),
@@ -220,21 +254,24 @@ class TerraformPlanParser:
     
     def _parse_action(self, actions: List[str]) -> ActionType:
         """Parse terraform actions into our ActionType enum"""
-        if not actions:
-            return ActionType.NO_OP
+        action = _ACTION_DISPATCH.get(tuple(actions))
+        if action is not None:
+            return action
+        
+        action_set = frozenset(actions)
         
         # Handle common action combinations
-        if "delete" in actions and "create" in actions:
+        if "delete" in action_set and "create" in action_set:
             return ActionType.RECREATE
-        elif "create" in actions:
+        elif "create" in action_set:
             return ActionType.CREATE
-        elif "delete" in actions:
+        elif "delete" in action_set:
             return ActionType.DELETE
-        elif "update" in actions:
+        elif "update" in action_set:
             return ActionType.UPDATE
-        elif "read" in actions:
+        elif "read" in action_set:
             return ActionType.READ
-        elif "no-op" in actions:
+        elif "no-op" in action_set:
             return ActionType.READ  # no-op means read-only operation
         else:
             # Default to no-op for unknown actions
@@ -242,19 +279,14 @@ class TerraformPlanParser:
     
     def _generate_summary(self, resource_changes: List[ResourceChange]) -> PlanSummary:
         """Generate a summary of plan changes"""
-        summary = PlanSummary()
-        
-        # Count all resources including no-op/read-only
-        summary.resources_total = len(resource_changes)
+        counts = Counter(map(attrgetter("action"), resource_changes))
+        recreate = counts[ActionType.RECREATE]
         
-        for change in resource_changes:
-            if change.action == ActionType.CREATE:
-                summary.create += 1
-            elif change.action == ActionType.UPDATE:
-                summary.update += 1
-            elif change.action in [ActionType.DELETE, ActionType.RECREATE]:
-                summary.delete += 1
-                if change.action == ActionType.RECREATE:
-                    summary.create += 1
-        
-        return summary
+        # Recreated resources count as both a create and a delete;
+        # resources_total includes no-op/read-only resources
+        return PlanSummary(
+            create=counts[ActionType.CREATE] + recreate,
+            update=counts[ActionType.UPDATE],
+            delete=counts[ActionType.DELETE] + recreate,
+            resources_total=len(resource_changes)
+        )
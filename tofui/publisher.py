@@ -6,19 +6,49 @@ Publishes tofUI report metadata to a centralized dashboard registry.
 Integrated from tofUI+ system.
 """
 
+import base64
+import functools
 import json
+import math
 import os
+import random
 import sys
-import re
-from datetime import datetime
-from typing import Optional, Dict, Any
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Callable
 
+try:
+    import requests
+    import requests.adapters
+except ImportError:
+    # Only needed for publishing; checked in publish_to_dashboard
+    requests = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .naming import sanitize_build_name  # re-exported for existing callers
+
+
+# Dashboard slot file name; the static dashboard builds the same names
+_SLOT_TEMPLATE = "{repo}-{folder}-{type}-{slot:03d}.json"
+
+# Fraction of each retry backoff that is randomized
+_BACKOFF_JITTER = 0.3
+
+# Longest Retry-After we honour, so a bad header cannot stall a CI job
+_MAX_RETRY_AFTER = 60.0
 
-def sanitize_build_name(name: str) -> str:
-    """Sanitize build name for URL and file system safety"""
-    sanitized = re.sub(r'[^a-zA-Z0-9\-.]', '-', name)
-    sanitized = re.sub(r'-+', '-', sanitized)
-    return sanitized.strip('-').lower()
+
+def _parse_zulu(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, treating a trailing Z as UTC"""
+    if timestamp.endswith('Z'):
+        return datetime.fromisoformat(timestamp[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(timestamp)
 
 
 def get_slot_filename(source_repo: str, folder: str, report_type: str, slot_number: int) -> str:
@@ -34,11 +64,55 @@ def get_slot_filename(source_repo: str, folder: str, report_type: str, slot_numb
     Returns:
         Filename in format: repo-folder-type-001.json
     """
-    repo_sanitized = source_repo.replace('/', '-')
-    folder_sanitized = folder or '_root'
-    type_sanitized = report_type or 'build'
-    slot_padded = str(slot_number).zfill(3)
-    return f"{repo_sanitized}-{folder_sanitized}-{type_sanitized}-{slot_padded}.json"
+    return _SLOT_TEMPLATE.format(
+        repo=source_repo.replace('/', '-'),
+        folder=folder or '_root',
+        type=report_type or 'build',
+        slot=slot_number
+    )
+
+
+def list_slot_files(api_base_url: str, dashboard_repo: str, branch: str, headers: dict, prefix: str) -> Optional[Dict[int, str]]:
+    """
+    List existing slot files for a prefix with a single directory request
+    
+    Args:
+        api_base_url: GitHub API base URL
+        dashboard_repo: Dashboard repository (owner/repo)
+        branch: Branch name
+        headers: API headers
+        prefix: Slot filename prefix (repo-folder-type-)
+    
+    Returns:
+        Dict of slot number to file sha, or None if the listing is unavailable
+    """
+    success, response = github_api_request_with_retry(
+        f"{api_base_url}/repos/{dashboard_repo}/contents/reports?ref={branch}",
+        headers,
+        {},
+        method="GET",
+        max_retries=3
+    )
+    
+    if not success:
+        # No reports directory yet means no slots are taken
+        if response is not None and response.status_code == 404:
+            return {}
+        return None
+    
+    entries = response.json()
+    # The contents API stops at 1000 entries; a truncated listing could hide slots
+    if not isinstance(entries, list) or len(entries) >= 1000:
+        return None
+    
+    slots = {}
+    for entry in entries:
+        name = entry.get('name', '')
+        if name.startswith(prefix) and name.endswith('.json'):
+            slot_part = name[len(prefix):-len('.json')]
+            if slot_part.isdigit():
+                slots[int(slot_part)] = entry.get('sha')
+    return slots
 
 
 def find_oldest_slot(api_base_url: str, dashboard_repo: str, source_repo: str, folder: str, report_type: str, branch: str, headers: dict, max_slots: int = 7) -> tuple:
@@ -58,11 +132,6 @@ def find_oldest_slot(api_base_url: str, dashboard_repo: str, source_repo: str, f
     Returns:
         tuple: (slot_number, sha, existing_report_data or None)
     """
-    import requests
-    import json
-    import base64
-    from datetime import datetime
-    
     print(f"🔍 Finding oldest slot for {source_repo}/{folder} ({report_type})...")
     
     oldest_slot = 1
@@ -70,54 +139,115 @@ def find_oldest_slot(api_base_url: str, dashboard_repo: str, source_repo: str, f
     oldest_sha = None
     oldest_data = None
     
-    # Check all slots
-    for slot in range(1, max_slots + 1):
+    # One directory listing answers the common case where a slot is still free
+    prefix = f"{source_repo.replace('/', '-')}-{folder or '_root'}-{report_type or 'build'}-"
+    existing = list_slot_files(api_base_url, dashboard_repo, branch, headers, prefix)
+    if existing is not None:
+        for slot in range(1, max_slots + 1):
+            if slot not in existing:
+                print(f"   Slot {slot}: Empty (will use this)")
+                return (slot, None, None)
+    
+    # With the listing's blob shas in hand, fetch raw file bodies instead of
+    # base64 envelopes
+    probe_headers = headers
+    if existing is not None:
+        probe_headers = {**headers, 'Accept': 'application/vnd.github.v3.raw'}
+    
+    def probe(slot):
+        # Buffer progress messages so concurrent probes don't interleave output
+        messages = []
         filename = get_slot_filename(source_repo, folder, report_type, slot)
-        file_path = f"reports/{filename}"
-        api_url = f"{api_base_url}/repos/{dashboard_repo}/contents/{file_path}"
+        api_url = f"{api_base_url}/repos/{dashboard_repo}/contents/reports/{filename}"
+        result = github_api_request_with_retry(
+            f"{api_url}?ref={branch}",
+            probe_headers,
+            {},
+            method="GET",
+            max_retries=3,
+            log=messages.append
+        )
+        return messages, result
+    
+    # Probe all slots concurrently, then walk the results in slot order so the
+    # lowest-numbered empty slot still wins
+    with ThreadPoolExecutor(max_workers=max_slots) as executor:
+        futures = [(slot, executor.submit(probe, slot)) for slot in range(1, max_slots + 1)]
         
-        try:
-            success, response = github_api_request_with_retry(
-                f"{api_url}?ref={branch}",
-                headers,
-                {},
-                method="GET",
-                max_retries=3
-            )
-            
-            if success and response.status_code == 200:
-                # Slot exists, check timestamp
-                content = base64.b64decode(response.json()['content']).decode('utf-8')
-                report_data = json.loads(content)
-                timestamp_str = report_data.get('timestamp', '')
+        for slot, future in futures:
+            try:
+                messages, (success, response) = future.result()
+                for message in messages:
+                    print(message)
                 
-                if timestamp_str:
-                    timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    
-                    if oldest_timestamp is None or timestamp < oldest_timestamp:
-                        oldest_slot = slot
-                        oldest_timestamp = timestamp
-                        oldest_sha = response.json()['sha']
-                        oldest_data = report_data
-                        print(f"   Slot {slot}: {timestamp_str} (current oldest)")
+                if success and response.status_code == 200:
+                    # Slot exists, check timestamp
+                    if existing is not None:
+                        report_data = json.loads(response.content)
+                        sha = existing[slot]
                     else:
-                        print(f"   Slot {slot}: {timestamp_str}")
-            else:
-                # Empty slot found - use it immediately
-                print(f"   Slot {slot}: Empty (will use this)")
+                        envelope = response.json()
+                        report_data = json.loads(base64.b64decode(envelope['content']))
+                        sha = envelope['sha']
+                    timestamp_str = report_data.get('timestamp', '')
+                    
+                    if timestamp_str:
+                        timestamp = _parse_zulu(timestamp_str)
+                        
+                        if oldest_timestamp is None or timestamp < oldest_timestamp:
+                            oldest_slot = slot
+                            oldest_timestamp = timestamp
+                            oldest_sha = sha
+                            oldest_data = report_data
+                            print(f"   Slot {slot}: {timestamp_str} (current oldest)")
+                        else:
+                            print(f"   Slot {slot}: {timestamp_str}")
+                else:
+                    # Empty slot found - use it immediately
+                    print(f"   Slot {slot}: Empty (will use this)")
+                    _cancel_pending(futures)
+                    return (slot, None, None)
+                    
+            except Exception as e:
+                # Slot doesn't exist or error - use it
+                print(f"   Slot {slot}: Empty or error (will use this)")
+                _cancel_pending(futures)
                 return (slot, None, None)
-                
-        except Exception as e:
-            # Slot doesn't exist or error - use it
-            print(f"   Slot {slot}: Empty or error (will use this)")
-            return (slot, None, None)
     
     # All slots full, return oldest
     print(f"✅ All slots full, will overwrite slot {oldest_slot} (oldest: {oldest_timestamp})")
     return (oldest_slot, oldest_sha, oldest_data)
 
 
-def github_api_request_with_retry(url: str, headers: dict, data: dict, method: str = "PUT", max_retries: int = 12) -> tuple:
+@functools.lru_cache(maxsize=None)
+def _get_session():
+    """Shared requests session so GitHub API calls reuse pooled connections"""
+    session = requests.Session()
+    # Large enough for the concurrent slot probes; retries are handled by the caller
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _retry_after_seconds(response) -> float:
+    """Seconds requested by a Retry-After header, capped at _MAX_RETRY_AFTER; 0 if absent or invalid"""
+    try:
+        seconds = float(response.headers.get('Retry-After', 0))
+    except (TypeError, ValueError):
+        return 0.0
+    if not math.isfinite(seconds) or seconds < 0:
+        return 0.0
+    return min(seconds, _MAX_RETRY_AFTER)
+
+
+def _cancel_pending(futures: list) -> None:
+    """Cancel slot probes that have not started yet"""
+    for _, future in futures:
+        future.cancel()
+
+
+def github_api_request_with_retry(url: str, headers: dict, data: dict, method: str = "PUT", max_retries: int = 12, log: Callable[[str], None] = print) -> tuple:
     """
     Make GitHub API request with exponential backoff retry logic
     
@@ -127,61 +257,64 @@ def github_api_request_with_retry(url: str, headers: dict, data: dict, method: s
         data: Request data (will be JSON encoded)
         method: HTTP method (PUT or GET)
         max_retries: Maximum number of retry attempts (default: 12)
+        log: Progress message sink (default: print)
     
     Returns:
         tuple: (success: bool, response: requests.Response or None)
     """
-    import requests
-    import json
-    import time
-    
+    session = _get_session()
     wait_time = 1.0  # Start with 1 second
     
     for attempt in range(1, max_retries + 1):
+        response = None
         try:
-            print(f"🔄 API Request attempt {attempt}/{max_retries}: {method} {url}")
+            log(f"🔄 API Request attempt {attempt}/{max_retries}: {method} {url}")
             
             if method.upper() == "PUT":
-                response = requests.put(url, headers=headers, data=json.dumps(data))
+                response = session.put(url, headers=headers, json=data)
             elif method.upper() == "GET":
-                response = requests.get(url, headers=headers)
+                response = session.get(url, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
-            print(f"📡 Response: {response.status_code} {response.reason}")
+            log(f"📡 Response: {response.status_code} {response.reason}")
             
             # Check if request was successful
             if response.status_code in [200, 201]:
                 if attempt > 1:
-                    print(f"✅ GitHub API request succeeded on attempt {attempt}")
+                    log(f"✅ GitHub API request succeeded on attempt {attempt}")
                 return True, response
             elif response.status_code == 409:
                 # Conflict - likely due to concurrent execution
-                print(f"⚠️  GitHub API conflict (409) on attempt {attempt}/{max_retries}")
+                log(f"⚠️  GitHub API conflict (409) on attempt {attempt}/{max_retries}")
                 if attempt == max_retries:
-                    print(f"❌ Maximum retries ({max_retries}) reached")
+                    log(f"❌ Maximum retries ({max_retries}) reached")
                     return False, response
             elif response.status_code in [500, 502, 503, 504]:
                 # Server errors - retry
-                print(f"⚠️  GitHub API server error ({response.status_code}) on attempt {attempt}/{max_retries}")
+                log(f"⚠️  GitHub API server error ({response.status_code}) on attempt {attempt}/{max_retries}")
                 if attempt == max_retries:
-                    print(f"❌ Maximum retries ({max_retries}) reached")
+                    log(f"❌ Maximum retries ({max_retries}) reached")
                     return False, response
             else:
                 # Other errors - don't retry
-                print(f"❌ GitHub API request failed with status {response.status_code}: {response.text}")
+                log(f"❌ GitHub API request failed with status {response.status_code}: {response.text}")
                 return False, response
                 
         except requests.exceptions.RequestException as e:
-            print(f"⚠️  GitHub API request exception on attempt {attempt}/{max_retries}: {e}")
+            log(f"⚠️  GitHub API request exception on attempt {attempt}/{max_retries}: {e}")
             if attempt == max_retries:
-                print(f"❌ Maximum retries ({max_retries}) reached")
+                log(f"❌ Maximum retries ({max_retries}) reached")
                 return False, None
         
         # Don't wait after the last attempt
         if attempt < max_retries:
-            print(f"⏳ Waiting {wait_time:.1f}s before retry...")
-            time.sleep(wait_time)
+            # Jitter spreads out retries from concurrent CI jobs hitting the same conflict
+            delay = wait_time * random.uniform(1 - _BACKOFF_JITTER, 1 + _BACKOFF_JITTER)
+            if response is not None:
+                delay = max(delay, _retry_after_seconds(response))
+            log(f"⏳ Waiting {delay:.1f}s before retry...")
+            time.sleep(delay)
             wait_time *= 2  # Double the wait time for next attempt
     
     return False, None
@@ -219,10 +352,7 @@ def publish_to_dashboard(
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        import requests
-        import base64
-    except ImportError:
+    if requests is None:
         print("❌ Error: requests is required. Install with: pip install requests", file=sys.stderr)
         return False
     
@@ -305,10 +435,14 @@ def publish_to_dashboard(
         api_url = f"{api_base_url}/repos/{dashboard_repo}/contents/{report_path}"
         
         # Upload report JSON file (with retry)
-        report_json = json.dumps(report_data, indent=2)
+        # Compact separators: the dashboard only parses this file, never displays it
+        if orjson is not None:
+            report_bytes = orjson.dumps(report_data)
+        else:
+            report_bytes = json.dumps(report_data, separators=(",", ":")).encode('utf-8')
         upload_data = {
             "message": f"Add report: {source_repo}/{folder_key}/{build_name}",
-            "content": base64.b64encode(report_json.encode('utf-8')).decode('ascii'),
+            "content": base64.b64encode(report_bytes).decode('ascii'),
             "branch": branch
         }
         
@@ -325,18 +459,18 @@ def publish_to_dashboard(
         )
         
         if success and response.status_code in [200, 201]:
-            print(f"✅ Successfully published report to slot {slot_number}!")
-            print(f"📊 Repository: {source_repo}")
-            print(f"📁 Folder: {folder or '(root)'}")
-            print(f"🏷️  Type: {type_key}")
-            print(f"🏗️  Build: {build_name}")
-            print(f"📄 Report file: {report_filename}")
-            print(f"🎰 Slot: {slot_number}/7")
-            
-            # Print statuses (raw codes only - dashboard handles formatting)
-            print(f"📋 Statuses:")
-            for status_type, status_code in statuses.items():
-                print(f"   {status_type}: {status_code}")
+            # Statuses are raw codes only - dashboard handles formatting
+            status_lines = "".join(f"\n   {status_type}: {status_code}" for status_type, status_code in statuses.items())
+            print(
+                f"✅ Successfully published report to slot {slot_number}!\n"
+                f"📊 Repository: {source_repo}\n"
+                f"📁 Folder: {folder or '(root)'}\n"
+                f"🏷️  Type: {type_key}\n"
+                f"🏗️  Build: {build_name}\n"
+                f"📄 Report file: {report_filename}\n"
+                f"🎰 Slot: {slot_number}/7\n"
+                f"📋 Statuses:{status_lines}"
+            )
             
             # Construct dashboard URL
             if github_enterprise_url:
@@ -354,7 +488,6 @@ def publish_to_dashboard(
             
     except Exception as e:
         print(f"❌ Error publishing to dashboard: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         return False
 